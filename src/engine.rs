@@ -83,10 +83,6 @@ pub(crate) fn diff_values(
         return;
     }
 
-    if values_equal(t1, t2, options) {
-        return;
-    }
-
     match (t1, t2) {
         (Value::Object(map1), Value::Object(map2)) => {
             for (key, value1) in map1 {
@@ -129,6 +125,9 @@ pub(crate) fn diff_values(
             }
         }
         _ => {
+            if values_equal(t1, t2, options) {
+                return;
+            }
             if types_compatible(t1, t2, options) {
                 acc.values_changed
                     .insert(path.to_string(), json_obj(old_new_value(t1, t2)));
@@ -188,22 +187,6 @@ fn values_equal(t1: &Value, t2: &Value, options: &DeepDiffOptions) -> bool {
         (Value::String(s1), Value::String(s2)) => s1 == s2,
         (Value::Bool(b1), Value::Bool(b2)) => b1 == b2,
         (Value::Null, Value::Null) => true,
-        (Value::Array(a1), Value::Array(a2)) => {
-            if options.ignore_order {
-                let mut counts1: HashMap<String, usize> = HashMap::new();
-                let mut counts2: HashMap<String, usize> = HashMap::new();
-                for item in a1 {
-                    *counts1.entry(canonical_string(item)).or_insert(0) += 1;
-                }
-                for item in a2 {
-                    *counts2.entry(canonical_string(item)).or_insert(0) += 1;
-                }
-                counts1 == counts2
-            } else {
-                a1 == a2
-            }
-        }
-        (Value::Object(o1), Value::Object(o2)) => o1 == o2,
         _ => false,
     }
 }
@@ -327,26 +310,52 @@ fn json_obj(entries: Vec<(&'static str, Value)>) -> Value {
 }
 
 pub(crate) fn canonical_string(value: &Value) -> String {
+    let mut out = String::new();
+    write_canonical(value, &mut out);
+    out
+}
+
+fn write_canonical(value: &Value, out: &mut String) {
+    use std::fmt::Write;
+
     match value {
-        Value::Null => "null".to_string(),
-        Value::Bool(b) => format!("bool:{}", b),
-        Value::Number(n) => format!("num:{}", n),
-        Value::String(s) => format!("str:{}", s),
+        Value::Null => out.push_str("null"),
+        Value::Bool(b) => {
+            let _ = write!(out, "bool:{}", b);
+        }
+        Value::Number(n) => {
+            let _ = write!(out, "num:{}", n);
+        }
+        Value::String(s) => {
+            out.push_str("str:");
+            out.push_str(s);
+        }
         Value::Array(arr) => {
-            let inner: Vec<String> = arr.iter().map(canonical_string).collect();
-            format!("list:[{}]", inner.join(","))
+            out.push_str("list:[");
+            for (idx, item) in arr.iter().enumerate() {
+                if idx > 0 {
+                    out.push(',');
+                }
+                write_canonical(item, out);
+            }
+            out.push(']');
         }
         Value::Object(obj) => {
             let mut keys: Vec<&String> = obj.keys().collect();
             keys.sort();
-            let mut parts = Vec::with_capacity(keys.len());
-            for key in keys {
+            out.push_str("dict:{");
+            for (idx, key) in keys.into_iter().enumerate() {
+                if idx > 0 {
+                    out.push(',');
+                }
                 let val = obj
                     .get(key)
                     .expect("key gathered from object keys must exist");
-                parts.push(format!("{}:{}", key, canonical_string(val)));
+                out.push_str(key);
+                out.push(':');
+                write_canonical(val, out);
             }
-            format!("dict:{{{}}}", parts.join(","))
+            out.push('}');
         }
     }
 }